@@ -9,19 +9,23 @@ class CountryAdmin(admin.ModelAdmin):
 @admin.register(Blog)
 class BlogAdmin(admin.ModelAdmin):
     list_display = ['title', 'author', 'created_at']
+    list_select_related = ['author']
     list_filter = ['created_at']
     search_fields = ['title']
 
 @admin.register(BlogView)
 class BlogViewAdmin(admin.ModelAdmin):
     list_display = ['blog', 'country', 'timestamp']
+    list_select_related = ['blog', 'country']
     list_filter = ['country', 'timestamp']
     date_hierarchy = 'timestamp'
+    ordering = ['-timestamp']
 
 
 @admin.register(DailyAnalyticsSummary)
 class DailyAnalyticsSummaryAdmin(admin.ModelAdmin):
     list_display = ['date', 'country', 'author', 'total_views', 'unique_blogs']
+    list_select_related = ['country', 'author']
     list_filter = ['country', 'date']
     date_hierarchy = 'date'
     readonly_fields = ['date', 'country', 'author', 'total_views', 'unique_blogs']
\ No newline at end of file
@@ -3,6 +3,7 @@ Analytics API Serializers
 
 Handles request validation and response formatting for analytics endpoints.
 """
+from copy import copy
 from datetime import timedelta
 
 from django.utils import timezone
@@ -11,18 +12,50 @@ from rest_framework import serializers
 
 # Constants
 RANGE_CHOICES = ['day', 'week', 'month', 'year']
-RANGE_DAYS = {
-    'day': 1,
-    'week': 7,
-    'month': 30,
-    'year': 365,
+RANGE_DELTAS = {
+    'day': timedelta(days=1),
+    'week': timedelta(weeks=1),
+    'month': timedelta(days=30),
+    'year': timedelta(days=365),
 }
 YEAR_MIN = 2000
 YEAR_MAX = 2100
 COUNTRY_CODE_MAX_LENGTH = 5
 
 
-class AnalyticsFilterSerializer(serializers.Serializer):
+class CachedFieldsMixin:
+    """
+    Build a serializer's fields once per class instead of once per instance.
+    
+    DRF deep-copies every declared field on each instantiation. These
+    serializers are instantiated on every analytics request, so the field
+    dict is cached on first use and each instance gets shallow copies.
+    """
+    _fields_cache = {}
+
+    def get_fields(self):
+        cls = self.__class__
+        if cls not in self._fields_cache:
+            self._fields_cache[cls] = super().get_fields()
+        return {name: self._copy_field(field) for name, field in self._fields_cache[cls].items()}
+
+    @classmethod
+    def _copy_field(cls, field):
+        """
+        Shallow copy of a cached field that shares no mutable state with it.
+        
+        Validator lists are copied, and a ListField gets its own child whose
+        parent is the copy rather than the cached field.
+        """
+        field = copy(field)
+        field.validators = list(field.validators)
+        if (child := getattr(field, 'child', None)) is not None:
+            field.child = cls._copy_field(child)
+            field.child.parent = field
+        return field
+
+
+class AnalyticsFilterSerializer(CachedFieldsMixin, serializers.Serializer):
     """
     Filter parameters for analytics endpoints.
     
@@ -105,17 +138,10 @@ class AnalyticsFilterSerializer(serializers.Serializer):
             })
         
         # Convert range to dates
-        if 'range' in data and data['range']:
-            now = timezone.now()
-            days = RANGE_DAYS.get(data['range'])
-            
-            if days is None:
-                raise serializers.ValidationError({
-                    'range': f"Invalid range. Must be one of: {', '.join(RANGE_CHOICES)}"
-                })
-            
+        if delta := RANGE_DELTAS.get(data.get('range')):
             # Override start_date/end_date if range is provided
-            data['start_date'] = now - timedelta(days=days)
+            now = timezone.now()
+            data['start_date'] = now - delta
             data['end_date'] = now
         
         return data
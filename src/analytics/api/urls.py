@@ -1,8 +1,11 @@
 from django.urls import path
-from .views import GroupedAnalyticsView, TopAnalyticsView, PerformanceAnalyticsView
+from .views import (
+    GroupedAnalyticsView, TopAnalyticsView, PerformanceAnalyticsView, DashboardAnalyticsView,
+)
 
 urlpatterns = [
     path('blog-views/<str:object_type>/', GroupedAnalyticsView.as_view(), name='grouped-analytics'),
     path('top/<str:top_type>/', TopAnalyticsView.as_view(), name='top-analytics'),
     path('performance/', PerformanceAnalyticsView.as_view(), name='performance-analytics'),
+    path('dashboard/<str:object_type>/<str:top_type>/', DashboardAnalyticsView.as_view(), name='dashboard-analytics'),
 ]
\ No newline at end of file
@@ -5,7 +5,9 @@ Endpoints:
     POST /api/analytics/blog-views/{object_type}/ - Grouped analytics
     POST /api/analytics/top/{top_type}/ - Top 10
     POST /api/analytics/performance/ - Time-series performance
+    POST /api/analytics/dashboard/{object_type}/{top_type}/ - All three at once
 """
+from asgiref.sync import async_to_sync
 from rest_framework import status
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
@@ -72,7 +74,7 @@ class GroupedAnalyticsView(BaseAnalyticsView):
 
 class TopAnalyticsView(BaseAnalyticsView):
     """
-    Get top 10 by total views.
+    Get top 10 by total views (using the daily rollup view).
     
     POST /api/analytics/top/{top_type}/
     
@@ -98,7 +100,7 @@ class TopAnalyticsView(BaseAnalyticsView):
         serializer = AnalyticsFilterSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         
-        data = AnalyticsService.get_top_analytics(
+        data = AnalyticsService.get_top_analytics_fast(
             top_type=top_type,
             filters=serializer.validated_data
         )
@@ -107,7 +109,7 @@ class TopAnalyticsView(BaseAnalyticsView):
 
 class PerformanceAnalyticsView(BaseAnalyticsView):
     """
-    Time-series performance with growth calculation.
+    Time-series performance with growth calculation (using the daily rollup view).
     
     POST /api/analytics/performance/
     
@@ -129,7 +131,52 @@ class PerformanceAnalyticsView(BaseAnalyticsView):
         serializer = AnalyticsFilterSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         
-        data = AnalyticsService.get_performance_analytics(
+        data = AnalyticsService.get_performance_analytics_fast(
+            filters=serializer.validated_data
+        )
+        return Response(data, status=status.HTTP_200_OK)
+
+
+class DashboardAnalyticsView(BaseAnalyticsView):
+    """
+    Grouped, top 10 and performance results for one dashboard load.
+    
+    POST /api/analytics/dashboard/{object_type}/{top_type}/
+    
+    The three queries run concurrently (see AnalyticsService.get_dashboard),
+    so a cold dashboard waits for the slowest one rather than their sum.
+    
+    Args:
+        object_type: 'country' or 'user' (grouped analytics)
+        top_type: 'blog', 'user', or 'country' (top 10)
+        
+    Returns:
+        {grouped: [...], top: [...], performance: [...]}
+    """
+    
+    @swagger_auto_schema(
+        operation_description="Grouped, top 10 and performance analytics in one request",
+        request_body=AnalyticsFilterSerializer,
+        responses={200: "{grouped, top, performance} lists of {x, y, z} objects"}
+    )
+    def post(self, request, object_type, top_type):
+        if object_type not in VALID_OBJECT_TYPES:
+            return Response(
+                {"error": f"object_type must be one of: {', '.join(VALID_OBJECT_TYPES)}"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if top_type not in VALID_TOP_TYPES:
+            return Response(
+                {"error": f"top_type must be one of: {', '.join(VALID_TOP_TYPES)}"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        serializer = AnalyticsFilterSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        
+        data = async_to_sync(AnalyticsService.get_dashboard)(
+            object_type=object_type,
+            top_type=top_type,
             filters=serializer.validated_data
         )
         return Response(data, status=status.HTTP_200_OK)
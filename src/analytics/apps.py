@@ -4,3 +4,17 @@ from django.apps import AppConfig
 class AnalyticsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'analytics'
+
+    def ready(self):
+        from django.db.models.signals import post_delete, post_save
+
+        from .models import Country
+        from .services import AnalyticsService
+
+        # Keep the in-process country code -> id table in sync
+        for signal in (post_save, post_delete):
+            signal.connect(
+                AnalyticsService.clear_country_ids,
+                sender=Country,
+                dispatch_uid='clear_country_ids',
+            )
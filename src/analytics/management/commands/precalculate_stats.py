@@ -5,18 +5,49 @@ Usage:
     python manage.py precalculate_stats           # All data
     python manage.py precalculate_stats --days=7  # Last 7 days
 
+Also refreshes the analytics_mv_daily_blog_views materialized view (always
+in full, regardless of --days).
+
 Scheduled in production via cron:
     0 1 * * * python manage.py precalculate_stats --days=1
 """
-from datetime import timedelta
+from datetime import datetime, time, timedelta, timezone as dt_timezone
 
-from django.contrib.auth.models import User
 from django.core.management.base import BaseCommand
-from django.db.models import Count
-from django.db.models.functions import TruncDate
+from django.db import connection, transaction
 from django.utils import timezone
 
-from analytics.models import BlogView, DailyAnalyticsSummary, Country
+from analytics.models import BlogView
+
+
+# Aggregate by day + country + author into a staging table first, so the
+# expensive GROUP BY runs before the summary table is touched
+STAGE_SQL = """
+    CREATE TEMP TABLE _stg_summary ON COMMIT DROP AS
+    SELECT bv.timestamp::date AS date, bv.country_id, b.author_id,
+           COUNT(*) AS total_views, COUNT(DISTINCT bv.blog_id) AS unique_blogs
+    FROM analytics_blogview bv
+    JOIN analytics_blog b ON b.id = bv.blog_id
+    WHERE bv.timestamp >= %s
+    GROUP BY 1, 2, 3
+"""
+DELETE_SQL = "DELETE FROM analytics_dailyanalyticssummary WHERE date >= %s"
+# Written in date order so the BRIN index on date stays tight
+INSERT_SQL = """
+    INSERT INTO analytics_dailyanalyticssummary
+        (date, country_id, author_id, total_views, unique_blogs)
+    SELECT date, country_id, author_id, total_views, unique_blogs
+    FROM _stg_summary
+    ORDER BY date
+"""
+# ON COMMIT DROP does not fire when nested in an outer transaction (e.g. tests)
+DROP_STAGE_SQL = "DROP TABLE _stg_summary"
+
+# Materialized views can only be rebuilt whole; CONCURRENTLY keeps the old
+# contents readable during the refresh
+REFRESH_ROLLUP_SQL = "REFRESH MATERIALIZED VIEW CONCURRENTLY analytics_mv_daily_blog_views"
+# The top view is aggregated from the rollup, so it is refreshed second
+REFRESH_TOP_SQL = "REFRESH MATERIALIZED VIEW CONCURRENTLY analytics_mv_top_views_all_time"
 
 
 class Command(BaseCommand):
@@ -39,43 +70,37 @@ class Command(BaseCommand):
             start_date = timezone.now().date() - timedelta(days=days)
             self.stdout.write(f"  Range: last {days} days")
         else:
-            earliest = BlogView.objects.order_by('timestamp').first()
+            earliest = (
+                BlogView.objects
+                .order_by('timestamp')
+                .values_list('timestamp', flat=True)
+                .first()
+            )
             if not earliest:
                 self.stdout.write(self.style.WARNING("No data found."))
                 return
-            start_date = earliest.timestamp.date()
+            start_date = earliest.date()
             self.stdout.write(f"  Range: {start_date} to today")
 
-        # Clear existing summaries
-        DailyAnalyticsSummary.objects.filter(date__gte=start_date).delete()
-
-        # Aggregate by day + country + author
-        aggregated = (
-            BlogView.objects
-            .filter(timestamp__date__gte=start_date)
-            .annotate(view_date=TruncDate('timestamp'))
-            .values('view_date', 'country', 'blog__author')
-            .annotate(
-                total_views=Count('id'),
-                unique_blogs=Count('blog', distinct=True)
-            )
-            .order_by('view_date')
-        )
+        # Views are matched on the bare timestamp so idx_timestamp_blog_country
+        # can range-scan; UTC midnight is the same day boundary as ::date
+        since = datetime.combine(start_date, time.min, tzinfo=dt_timezone.utc)
 
-        # Bulk create summaries
-        summaries = [
-            DailyAnalyticsSummary(
-                date=row['view_date'],
-                country_id=row['country'],
-                author_id=row['blog__author'],
-                total_views=row['total_views'],
-                unique_blogs=row['unique_blogs']
-            )
-            for row in aggregated
-        ]
-        
-        DailyAnalyticsSummary.objects.bulk_create(summaries, batch_size=1000)
+        # Swap summaries server-side in one transaction: no rows pass through
+        # Python, and readers keep seeing the old summaries until commit
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(STAGE_SQL, [since])
+            cursor.execute(DELETE_SQL, [start_date])
+            cursor.execute(INSERT_SQL)
+            created = cursor.rowcount
+            cursor.execute(DROP_STAGE_SQL)
 
         self.stdout.write(self.style.SUCCESS(
-            f"Created {len(summaries)} summary records"
+            f"Created {created} summary records"
         ))
+
+        self.stdout.write("Refreshing daily rollup and top views...")
+        with connection.cursor() as cursor:
+            cursor.execute(REFRESH_ROLLUP_SQL)
+            cursor.execute(REFRESH_TOP_SQL)
+        self.stdout.write(self.style.SUCCESS("Rollup and top views refreshed"))
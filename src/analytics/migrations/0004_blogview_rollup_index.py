@@ -0,0 +1,140 @@
+# Generated by Django 4.2.30 on 2026-10-14 19:06
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('analytics', '0003_dailyanalyticssummary'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='blog',
+            options={'ordering': ['-created_at']},
+        ),
+        migrations.AlterModelOptions(
+            name='blogview',
+            options={'ordering': ['-timestamp'], 'verbose_name': 'Blog View', 'verbose_name_plural': 'Blog Views'},
+        ),
+        migrations.AlterModelOptions(
+            name='country',
+            options={'ordering': ['code'], 'verbose_name': 'Country', 'verbose_name_plural': 'Countries'},
+        ),
+        migrations.AlterModelOptions(
+            name='dailyanalyticssummary',
+            options={'ordering': ['-date', 'country'], 'verbose_name': 'Daily Analytics Summary', 'verbose_name_plural': 'Daily Analytics Summaries'},
+        ),
+        migrations.RenameIndex(
+            model_name='blogview',
+            new_name='idx_timestamp_country',
+            old_name='analytics_b_timesta_4d5d03_idx',
+        ),
+        migrations.RenameIndex(
+            model_name='blogview',
+            new_name='idx_blog_timestamp',
+            old_name='analytics_b_blog_id_8cfe76_idx',
+        ),
+        migrations.RenameIndex(
+            model_name='dailyanalyticssummary',
+            new_name='idx_summary_date_country',
+            old_name='analytics_d_date_ebd0b6_idx',
+        ),
+        migrations.RenameIndex(
+            model_name='dailyanalyticssummary',
+            new_name='idx_summary_date_author',
+            old_name='analytics_d_date_b4b394_idx',
+        ),
+        migrations.AlterField(
+            model_name='blog',
+            name='author',
+            field=models.ForeignKey(help_text='Author of the blog post', on_delete=django.db.models.deletion.CASCADE, related_name='blogs', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AlterField(
+            model_name='blog',
+            name='content',
+            field=models.TextField(help_text='Blog post content'),
+        ),
+        migrations.AlterField(
+            model_name='blog',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True, db_index=True, help_text='When the blog was created'),
+        ),
+        migrations.AlterField(
+            model_name='blog',
+            name='title',
+            field=models.CharField(help_text='Blog post title', max_length=255),
+        ),
+        migrations.AlterField(
+            model_name='blogview',
+            name='blog',
+            field=models.ForeignKey(help_text='The blog post that was viewed', on_delete=django.db.models.deletion.CASCADE, related_name='views', to='analytics.blog'),
+        ),
+        migrations.AlterField(
+            model_name='blogview',
+            name='country',
+            field=models.ForeignKey(blank=True, help_text='Country where the view originated', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='views', to='analytics.country'),
+        ),
+        migrations.AlterField(
+            model_name='blogview',
+            name='ip_address',
+            field=models.GenericIPAddressField(blank=True, help_text='IP address of the viewer', null=True),
+        ),
+        migrations.AlterField(
+            model_name='blogview',
+            name='timestamp',
+            field=models.DateTimeField(auto_now_add=True, db_index=True, help_text='When the view occurred'),
+        ),
+        migrations.AlterField(
+            model_name='blogview',
+            name='viewer',
+            field=models.ForeignKey(blank=True, help_text='Registered user who viewed (if logged in)', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='viewed_blogs', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AlterField(
+            model_name='country',
+            name='code',
+            field=models.CharField(db_index=True, help_text="ISO country code (e.g., 'US', 'UK')", max_length=5, unique=True),
+        ),
+        migrations.AlterField(
+            model_name='country',
+            name='name',
+            field=models.CharField(help_text='Full country name', max_length=100),
+        ),
+        migrations.AlterField(
+            model_name='dailyanalyticssummary',
+            name='author',
+            field=models.ForeignKey(blank=True, help_text='Author (null = all authors)', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='daily_summaries', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AlterField(
+            model_name='dailyanalyticssummary',
+            name='country',
+            field=models.ForeignKey(blank=True, help_text='Country (null = all countries)', null=True, on_delete=django.db.models.deletion.CASCADE, related_name='daily_summaries', to='analytics.country'),
+        ),
+        migrations.AlterField(
+            model_name='dailyanalyticssummary',
+            name='date',
+            field=models.DateField(db_index=True, help_text='Date of the summary'),
+        ),
+        migrations.AlterField(
+            model_name='dailyanalyticssummary',
+            name='total_views',
+            field=models.IntegerField(default=0, help_text='Total views for this date/country/author combination'),
+        ),
+        migrations.AlterField(
+            model_name='dailyanalyticssummary',
+            name='unique_blogs',
+            field=models.IntegerField(default=0, help_text='Number of unique blogs viewed'),
+        ),
+        migrations.AddIndex(
+            model_name='blog',
+            index=models.Index(fields=['author', 'created_at'], name='analytics_b_author__43b6cb_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='blogview',
+            index=models.Index(fields=['timestamp', 'blog', 'country'], name='idx_timestamp_blog_country'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-10-14 19:10
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analytics', '0004_blogview_rollup_index'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='blogview',
+            options={'verbose_name': 'Blog View', 'verbose_name_plural': 'Blog Views'},
+        ),
+    ]
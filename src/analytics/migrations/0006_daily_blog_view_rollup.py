@@ -0,0 +1,57 @@
+# Generated by Django 4.2.30 on 2026-10-14 19:11
+
+from django.db import migrations, models
+
+
+# Dates are bucketed in UTC explicitly so a refresh from any session
+# (cron, psql) produces the same rows as one from Django. The id is hashed
+# from the unique key, so a row keeps its id across refreshes and
+# REFRESH ... CONCURRENTLY only rewrites rows whose counts changed.
+CREATE_ROLLUP_SQL = """
+CREATE MATERIALIZED VIEW analytics_mv_daily_blog_views AS
+SELECT hashtextextended(
+           concat_ws('|', (bv.timestamp AT TIME ZONE 'UTC')::date, bv.blog_id, bv.country_id), 0
+       ) AS id,
+       (bv.timestamp AT TIME ZONE 'UTC')::date AS date,
+       bv.blog_id,
+       bv.country_id,
+       b.author_id,
+       COUNT(*)::int AS total_views
+FROM analytics_blogview bv
+JOIN analytics_blog b ON b.id = bv.blog_id
+GROUP BY 2, 3, 4, 5
+WITH DATA;
+
+-- Required by REFRESH MATERIALIZED VIEW CONCURRENTLY
+CREATE UNIQUE INDEX idx_rollup_date_blog_country
+    ON analytics_mv_daily_blog_views (date, blog_id, country_id);
+CREATE INDEX idx_rollup_date_country ON analytics_mv_daily_blog_views (date, country_id);
+CREATE INDEX idx_rollup_date_author ON analytics_mv_daily_blog_views (date, author_id);
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analytics', '0005_remove_blogview_ordering'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql=CREATE_ROLLUP_SQL,
+            reverse_sql="DROP MATERIALIZED VIEW IF EXISTS analytics_mv_daily_blog_views;",
+        ),
+        migrations.CreateModel(
+            name='DailyBlogViewRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('total_views', models.IntegerField()),
+            ],
+            options={
+                'verbose_name': 'Daily Blog View Rollup',
+                'db_table': 'analytics_mv_daily_blog_views',
+                'managed': False,
+            },
+        ),
+    ]
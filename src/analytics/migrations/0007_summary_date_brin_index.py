@@ -0,0 +1,23 @@
+# Generated by Django 4.2.30 on 2026-10-14 19:20
+
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analytics', '0006_daily_blog_view_rollup'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='dailyanalyticssummary',
+            name='date',
+            field=models.DateField(help_text='Date of the summary'),
+        ),
+        migrations.AddIndex(
+            model_name='dailyanalyticssummary',
+            index=django.contrib.postgres.indexes.BrinIndex(fields=['date'], name='idx_summary_date_brin'),
+        ),
+    ]
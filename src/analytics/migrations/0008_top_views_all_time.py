@@ -0,0 +1,76 @@
+# Generated by Django 4.2.30 on 2026-10-14 19:24
+
+from django.db import migrations, models
+
+
+# Same groupings as AnalyticsService.TOP_CONFIG, over all time. Each branch
+# keeps its own top 10 (ties broken by x, as in _aggregate_top), so the view
+# stays 30 rows at any data size. The id is hashed from (top_type, x) so it
+# is stable across refreshes. Aggregated from the daily rollup rather than
+# raw BlogView rows, so a refresh scans the event table only once (for the
+# rollup); views are additive across days and the rollup keeps blog and
+# country, so every count is exact.
+CREATE_TOP_SQL = """
+CREATE MATERIALIZED VIEW analytics_mv_top_views_all_time AS
+SELECT hashtextextended(concat_ws('|', top.top_type, top.x), 0) AS id, top.*
+FROM (
+    (SELECT 'blog'::text AS top_type, b.title::text AS x,
+            SUM(r.total_views)::int AS y, COUNT(DISTINCT r.country_id)::int AS z
+     FROM analytics_mv_daily_blog_views r
+     JOIN analytics_blog b ON b.id = r.blog_id
+     GROUP BY b.title
+     ORDER BY y DESC, b.title LIMIT 10)
+    UNION ALL
+    (SELECT 'user'::text, u.username::text,
+            SUM(r.total_views)::int AS y, COUNT(DISTINCT r.blog_id)::int
+     FROM analytics_mv_daily_blog_views r
+     JOIN auth_user u ON u.id = r.author_id
+     GROUP BY u.username
+     ORDER BY y DESC, u.username LIMIT 10)
+    UNION ALL
+    (SELECT 'country'::text, c.code::text,
+            SUM(r.total_views)::int AS y, COUNT(DISTINCT r.blog_id)::int
+     FROM analytics_mv_daily_blog_views r
+     LEFT JOIN analytics_country c ON c.id = r.country_id
+     GROUP BY c.code
+     ORDER BY y DESC, c.code LIMIT 10)
+) top
+WITH DATA;
+
+-- Required by REFRESH MATERIALIZED VIEW CONCURRENTLY (x is NULL for views
+-- without a country)
+CREATE UNIQUE INDEX idx_top_all_time_type_x
+    ON analytics_mv_top_views_all_time (top_type, x) NULLS NOT DISTINCT;
+"""
+
+
+class Migration(migrations.Migration):
+
+    # The view reads auth_user.username; Postgres refuses to alter a column
+    # a view depends on, so every auth migration must run first
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('analytics', '0007_summary_date_brin_index'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql=CREATE_TOP_SQL,
+            reverse_sql="DROP MATERIALIZED VIEW IF EXISTS analytics_mv_top_views_all_time;",
+        ),
+        migrations.CreateModel(
+            name='TopViewsAllTime',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('top_type', models.CharField(max_length=10)),
+                ('x', models.CharField(max_length=255, null=True)),
+                ('y', models.IntegerField()),
+                ('z', models.IntegerField()),
+            ],
+            options={
+                'verbose_name': 'Top Views (All Time)',
+                'db_table': 'analytics_mv_top_views_all_time',
+                'managed': False,
+            },
+        ),
+    ]
@@ -6,8 +6,11 @@ Database schema for analytics system:
     - Blog: Blog posts authored by users
     - BlogView: Fact table storing each view event
     - DailyAnalyticsSummary: Pre-calculated daily aggregates
+    - DailyBlogViewRollup: Materialized view of daily views per blog
+    - TopViewsAllTime: Materialized view of the unfiltered top 10s
 """
 from django.contrib.auth.models import User
+from django.contrib.postgres.indexes import BrinIndex
 from django.db import models
 
 
@@ -75,6 +78,7 @@ class BlogView(models.Model):
         - Time range (timestamp)
         - Country (country)
         - Blog (blog)
+        - Daily rollups (timestamp, blog, country)
     """
     blog = models.ForeignKey(
         Blog,
@@ -110,12 +114,16 @@ class BlogView(models.Model):
     )
 
     class Meta:
-        ordering = ['-timestamp']
+        # No default ordering: this is an aggregation-only fact table, and a
+        # default ORDER BY would leak into every query that doesn't override it
         verbose_name = "Blog View"
         verbose_name_plural = "Blog Views"
         indexes = [
             models.Index(fields=['timestamp', 'country'], name='idx_timestamp_country'),
             models.Index(fields=['blog', 'timestamp'], name='idx_blog_timestamp'),
+            # Covers the precalculate_stats rollup (timestamp range, grouped
+            # by blog and country) so it can run as an index-only scan
+            models.Index(fields=['timestamp', 'blog', 'country'], name='idx_timestamp_blog_country'),
         ]
 
     def __str__(self):
@@ -137,7 +145,6 @@ class DailyAnalyticsSummary(models.Model):
     Example: 1 year of data = 365 rows instead of 10,000+ events.
     """
     date = models.DateField(
-        db_index=True,
         help_text="Date of the summary"
     )
     country = models.ForeignKey(
@@ -172,6 +179,10 @@ class DailyAnalyticsSummary(models.Model):
         indexes = [
             models.Index(fields=['date', 'country'], name='idx_summary_date_country'),
             models.Index(fields=['date', 'author'], name='idx_summary_date_author'),
+            # Rows are written in date order by precalculate_stats, so a BRIN
+            # index stays a few pages at any size; the btrees above (and the
+            # unique key) already lead with date for point lookups
+            BrinIndex(fields=['date'], name='idx_summary_date_brin'),
         ]
         ordering = ['-date', 'country']
 
@@ -179,3 +190,67 @@ class DailyAnalyticsSummary(models.Model):
         country_str = str(self.country) if self.country else "All"
         author_str = self.author.username if self.author else "All"
         return f"{self.date} | {country_str} | {author_str} | {self.total_views} views"
+
+
+class DailyBlogViewRollup(models.Model):
+    """
+    Daily view counts per blog and country (PostgreSQL materialized view).
+    
+    Backs the top and performance endpoints. Unlike DailyAnalyticsSummary it
+    keeps the blog dimension, so distinct-blog counts stay exact over any
+    date range and the blog_id filter still applies.
+    
+    Read-only; created by migration 0006 and refreshed by
+    python manage.py precalculate_stats.
+    """
+    date = models.DateField()
+    blog = models.ForeignKey(
+        Blog,
+        on_delete=models.DO_NOTHING,
+        related_name='+'
+    )
+    country = models.ForeignKey(
+        Country,
+        on_delete=models.DO_NOTHING,
+        null=True,
+        related_name='+'
+    )
+    author = models.ForeignKey(
+        User,
+        on_delete=models.DO_NOTHING,
+        related_name='+'
+    )
+    total_views = models.IntegerField()
+
+    class Meta:
+        managed = False
+        db_table = 'analytics_mv_daily_blog_views'
+        verbose_name = "Daily Blog View Rollup"
+
+    def __str__(self):
+        return f"{self.date} | blog {self.blog_id} | {self.total_views} views"
+
+
+class TopViewsAllTime(models.Model):
+    """
+    All-time top 10 blogs, users and countries (PostgreSQL materialized view).
+    
+    Serves the unfiltered top endpoint, which dashboards load first, without
+    aggregating the whole rollup. Rows mirror the API shape: x = name,
+    y = total views, z = unique count.
+    
+    Read-only; created by migration 0008 and refreshed by
+    python manage.py precalculate_stats.
+    """
+    top_type = models.CharField(max_length=10)
+    x = models.CharField(max_length=255, null=True)
+    y = models.IntegerField()
+    z = models.IntegerField()
+
+    class Meta:
+        managed = False
+        db_table = 'analytics_mv_top_views_all_time'
+        verbose_name = "Top Views (All Time)"
+
+    def __str__(self):
+        return f"{self.top_type} | {self.x} | {self.y} views"
@@ -4,18 +4,29 @@ Analytics Service Module
 Handles all analytics aggregation logic with caching support.
 Provides both real-time and pre-calculated query methods.
 """
+import asyncio
 import hashlib
-import json
 import logging
-from datetime import datetime, date
+import time
+from functools import lru_cache
+from datetime import datetime, date, time as dt_time, timezone as dt_timezone
 from typing import List, Dict
 
-from django.core.cache import cache
-from django.db.models import Count, F, Q, Sum, Min, Max
-from django.db.models.functions import TruncMonth, TruncWeek, TruncDay
+from asgiref.sync import sync_to_async
+from django.contrib.auth.models import User
+from django.core.cache import cache, caches
+from django.db import connection
+from django.db.models import (
+    Case, CharField, Count, DateField, DateTimeField, F, Func, IntegerField, Q, Subquery,
+    Sum, Min, Max, Value, When, Window,
+)
+from django.db.models.functions import Cast, Lag, TruncDate, TruncMonth, TruncWeek
+from django.db.models.lookups import GreaterThan
 from django.utils import timezone
 
-from .models import BlogView, DailyAnalyticsSummary
+from .models import (
+    Blog, BlogView, Country, DailyAnalyticsSummary, DailyBlogViewRollup, TopViewsAllTime,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -29,15 +40,196 @@ class AnalyticsService:
         get_top_analytics: Get top 10 by views
         get_performance_analytics: Time-series with growth calculation
         get_grouped_analytics_fast: Pre-calculated version (faster)
+        get_top_analytics_fast: Top 10 from the daily rollup / all-time top view
+        get_performance_analytics_fast: Time-series from the daily rollup view
+        get_dashboard: APIs #1-#3 fetched concurrently (async)
     """
     
     CACHE_TIMEOUT = 60 * 15  # 15 minutes
+    STALE_TIMEOUT = 2 * CACHE_TIMEOUT  # stale results are still served during a refresh
+    # Versioned so keys never collide with entries from older key schemes
+    # or serializers (v3: msgpack instead of pickle)
+    CACHE_KEY_PREFIX = "analytics:v3"
+    LOCAL_CACHE_TIMEOUT = 60  # per-process tier, bounds staleness across workers
+    LOCK_TIMEOUT = 30  # upper bound on a single recomputation
+    LOCK_POLL_INTERVAL = 0.05
+
+    # Configuration dict: maps top_type to (grouping_field, z_metric)
+    # This avoids repetitive if/elif chains and makes it easy to add new types.
+    # Built once at import; None groups by the source's author field.
+    TOP_CONFIG = {
+        'blog': ('blog__title', Count('country', distinct=True)),
+        'user': (None, Count('blog', distinct=True)),
+        'country': ('country__code', Count('blog', distinct=True)),
+    }
+
+    # In-process country code -> id table. Countries are a tiny, rarely
+    # changing set, so filters match country_id directly instead of joining
+    # analytics_country. Cleared on Country save/delete (see apps.py).
+    _country_ids: Dict[str, int] = {}
+
+    @classmethod
+    def _resolve_country_ids(cls, codes: List[str]) -> List[int]:
+        """
+        Translate country codes to ids via the in-process table.
+        
+        Reloads the table when a code is missing, so countries created by
+        another process are picked up. Unknown codes are dropped.
+        """
+        if any(code not in cls._country_ids for code in codes):
+            cls._country_ids = dict(Country.objects.values_list('code', 'id'))
+        return [cls._country_ids[code] for code in codes if code in cls._country_ids]
+
+    @classmethod
+    def clear_country_ids(cls, **kwargs):
+        """Drop the country lookup table (connected to Country signals)."""
+        cls._country_ids = {}
+
+    @classmethod
+    def _freeze_filters(cls, filters: Dict) -> tuple:
+        """
+        Hashable, order-independent signature of a filter dict.
+        
+        Country codes are resolved to ids here rather than inside the memoized
+        builders, so a cached Q never outlives the country table it was built from.
+        """
+        frozen = {}
+        for key, value in filters.items():
+            if key in ('country_codes', 'exclude_country_codes'):
+                if not value:
+                    continue
+                # May resolve to () for unknown codes, which must still match nothing
+                value = cls._resolve_country_ids(value)
+            if isinstance(value, (list, set)):
+                value = tuple(value)
+            frozen[key] = value
+        return tuple(sorted(frozen.items()))
+
+    @classmethod
+    def _canonical(cls, value):
+        """
+        Order-independent, repr()-stable form of cache key parameters.
+        
+        Cheaper than JSON-encoding the filters just to hash them. Dates and
+        datetimes become ISO strings, so equal values always give equal keys.
+        """
+        if isinstance(value, dict):
+            return tuple(sorted((key, cls._canonical(item)) for key, item in value.items()))
+        if isinstance(value, (list, tuple)):
+            return tuple(cls._canonical(item) for item in value)
+        if isinstance(value, set):
+            return tuple(sorted(cls._canonical(item) for item in value))
+        if isinstance(value, date):  # includes datetime
+            return value.isoformat()
+        return value
 
     @classmethod
     def _generate_cache_key(cls, prefix: str, **kwargs) -> str:
         """Generate deterministic cache key from parameters."""
-        payload = json.dumps(kwargs, sort_keys=True, default=str)
-        return f"analytics:{prefix}:{hashlib.md5(payload.encode()).hexdigest()}"
+        # Unfiltered requests (dashboard landing pages) get a fixed key with
+        # no canonicalization or hashing; 'all' can never equal a hex digest
+        if not kwargs.get('filters') and kwargs.keys() <= {'type', 'filters'}:
+            return f"{cls.CACHE_KEY_PREFIX}:{prefix}:{kwargs.get('type', '_')}:all"
+        return cls._cache_key_for(prefix, cls._canonical(kwargs))
+
+    @classmethod
+    @lru_cache(maxsize=2048)
+    def _cache_key_for(cls, prefix: str, signature: tuple) -> str:
+        """Hash a canonical parameter signature, once per process per signature."""
+        digest = hashlib.blake2b(repr(signature).encode(), digest_size=16).hexdigest()
+        return f"{cls.CACHE_KEY_PREFIX}:{prefix}:{digest}"
+
+    @classmethod
+    def _cache_get(cls, key: str):
+        """
+        Read through the per-process cache, then the shared Redis cache.
+        
+        Dashboards re-poll the same keys, so hot results are served without
+        a network round-trip. Redis hits are copied into the local tier.
+        Stale Redis entries are returned too; see _get_or_compute().
+        """
+        local_cache = caches['local']
+        if (data := local_cache.get(key)) is not None:
+            return data
+        if (data := cache.get(key)) is not None:
+            local_cache.set(key, data, timeout=cls.LOCAL_CACHE_TIMEOUT)
+        return data
+
+    @classmethod
+    def _cache_get_many(cls, keys: List[str]) -> Dict:
+        """
+        Batch form of _cache_get(): one Redis MGET for local-tier misses.
+        
+        Only fresh Redis entries count as found, so stale ones still go
+        through _get_or_compute() to be refreshed.
+        """
+        local_cache = caches['local']
+        found = local_cache.get_many(keys)
+        if missing := [key for key in keys if key not in found]:
+            remote = cache.get_many(missing + [f"{key}:fresh" for key in missing])
+            fresh = {key: remote[key] for key in missing if key in remote and f"{key}:fresh" in remote}
+            local_cache.set_many(fresh, timeout=cls.LOCAL_CACHE_TIMEOUT)
+            found.update(fresh)
+        return found
+
+    @classmethod
+    def _cache_set(cls, key: str, data) -> None:
+        """
+        Store a result in both cache tiers.
+        
+        Redis keeps the value for STALE_TIMEOUT, and a separate ':fresh'
+        marker for CACHE_TIMEOUT records whether it is still fresh.
+        """
+        cache.set(key, data, timeout=cls.STALE_TIMEOUT)
+        cache.set(f"{key}:fresh", 1, timeout=cls.CACHE_TIMEOUT)
+        caches['local'].set(key, data, timeout=cls.LOCAL_CACHE_TIMEOUT)
+
+    @classmethod
+    def _get_or_compute(cls, key: str, compute):
+        """
+        Return the cached result for key, computing it at most once at a time.
+        
+        Only the worker that wins the Redis lock runs compute(). While a
+        stale value exists, the others keep serving it until the refresh
+        lands (stale-while-revalidate). On a cold key they poll for the
+        result instead of repeating the same aggregation. If the lock
+        outlives LOCK_TIMEOUT (crashed worker), the waiter computes the
+        result itself.
+        """
+        local_cache = caches['local']
+        if (cached := local_cache.get(key)) is not None:
+            return cached
+
+        # Value and freshness marker in one round-trip
+        fresh_key = f"{key}:fresh"
+        found = cache.get_many([key, fresh_key])
+        cached = found.get(key)
+        if cached is not None and fresh_key in found:
+            local_cache.set(key, cached, timeout=cls.LOCAL_CACHE_TIMEOUT)
+            return cached
+
+        lock_key = f"{key}:lock"
+        locked = cache.add(lock_key, 1, timeout=cls.LOCK_TIMEOUT)
+        if not locked:
+            if cached is not None:
+                return cached
+            deadline = time.monotonic() + cls.LOCK_TIMEOUT
+            while time.monotonic() < deadline:
+                time.sleep(cls.LOCK_POLL_INTERVAL)
+                if (cached := cls._cache_get(key)) is not None:
+                    return cached
+                if locked := cache.add(lock_key, 1, timeout=cls.LOCK_TIMEOUT):
+                    break
+
+        try:
+            # Empty results are cached too, so a filter matching nothing is
+            # computed once rather than once per queued waiter
+            data = compute()
+            cls._cache_set(key, data)
+            return data
+        finally:
+            if locked:
+                cache.delete(lock_key)
 
     @classmethod
     def _build_blogview_filters(cls, filters: Dict) -> Q:
@@ -53,6 +245,13 @@ class AnalyticsService:
         Instead of complex conditional filtering chains, we build a declarative
         query object that clearly expresses the filtering logic.
         """
+        return cls._blogview_q(cls._freeze_filters(filters))
+
+    @classmethod
+    @lru_cache(maxsize=512)
+    def _blogview_q(cls, frozen: tuple) -> Q:
+        """Q object for a frozen filter signature, memoized for repeated dashboard polls."""
+        filters = dict(frozen)
         q_objects = Q()
         
         # Date filters (mutually exclusive: year OR date range)
@@ -64,15 +263,17 @@ class AnalyticsService:
             if end_date := filters.get('end_date'):
                 q_objects &= Q(timestamp__lte=end_date)
         
-        # Country filters
-        if country_codes := filters.get('country_codes'):
-            q_objects &= Q(country__code__in=country_codes)
-        if exclude_codes := filters.get('exclude_country_codes'):
-            q_objects &= ~Q(country__code__in=exclude_codes)
+        # Country filters (already resolved to ids by _freeze_filters)
+        if (country_ids := filters.get('country_codes')) is not None:
+            q_objects &= Q(country_id__in=country_ids)
+        if (exclude_ids := filters.get('exclude_country_codes')) is not None:
+            q_objects &= ~Q(country_id__in=exclude_ids)
         
         # Author and blog filters
+        # Author as a semi-join on blog ids, so the outer query joins neither
+        # analytics_blog nor auth_user just to filter
         if author := filters.get('author_username'):
-            q_objects &= Q(blog__author__username=author)
+            q_objects &= Q(blog_id__in=Blog.objects.filter(author__username=author).values('id'))
         if blog_id := filters.get('blog_id'):
             q_objects &= Q(blog_id=blog_id)
         
@@ -83,6 +284,8 @@ class AnalyticsService:
         """
         Apply filters to BlogView queryset using declarative Q objects.
         
+        Takes the manager directly too; .filter() makes the only clone.
+        
         Supports:
             - year, start_date, end_date (time filters)
             - country_codes (OR logic)
@@ -106,23 +309,21 @@ class AnalyticsService:
         """
         cache_key = cls._generate_cache_key("grouped", type=object_type, filters=filters)
         
-        if cached := cache.get(cache_key):
-            return cached
+        def compute():
+            queryset = cls._apply_filters(BlogView.objects, filters)
 
-        queryset = BlogView.objects.select_related('blog', 'blog__author', 'country')
-        queryset = cls._apply_filters(queryset, filters)
+            group_field = 'country__code' if object_type == 'country' else 'blog__author__username'
 
-        group_field = 'country__code' if object_type == 'country' else 'blog__author__username'
-        
-        data = list(
-            queryset
-            .values(x=F(group_field))
-            .annotate(y=Count('blog', distinct=True), z=Count('id'))
-            .order_by('-z')
-        )
+            # Tuples are cheaper to build than per-row dicts; shape them once here
+            rows = (
+                queryset
+                .values_list(group_field)
+                .annotate(y=Count('blog', distinct=True), z=Count('id'))
+                .order_by('-z')
+            )
+            return [{'x': x, 'y': y, 'z': z} for x, y, z in rows]
 
-        cache.set(cache_key, data, timeout=cls.CACHE_TIMEOUT)
-        return data
+        return cls._get_or_compute(cache_key, compute)
 
     @classmethod
     def get_top_analytics(cls, top_type: str, filters: Dict) -> List[Dict]:
@@ -138,38 +339,39 @@ class AnalyticsService:
         """
         cache_key = cls._generate_cache_key("top", type=top_type, filters=filters)
         
-        if cached := cache.get(cache_key):
-            return cached
+        def compute():
+            queryset = cls._apply_filters(BlogView.objects, filters)
+            return cls._aggregate_top(queryset, top_type, 'blog__author__username', Count('id'))
 
-        queryset = BlogView.objects.select_related('blog', 'blog__author', 'country')
-        queryset = cls._apply_filters(queryset, filters)
+        return cls._get_or_compute(cache_key, compute)
 
-        # Configuration dict: maps top_type to (grouping_field, z_metric)
-        # This avoids repetitive if/elif chains and makes it easy to add new types
-        config = {
-            'blog': ('blog__title', Count('country', distinct=True)),
-            'user': ('blog__author__username', Count('blog', distinct=True)),
-            'country': ('country__code', Count('blog', distinct=True)),
-        }
+    @classmethod
+    def _aggregate_top(cls, queryset, top_type: str, author_field: str, views) -> List[Dict]:
+        """
+        Top 10 aggregation shared by the BlogView and rollup sources.
         
-        group_field, z_metric = config[top_type]
+        Args:
+            queryset: Filtered BlogView or DailyBlogViewRollup queryset
+            top_type: 'blog', 'user', or 'country'
+            author_field: Lookup for the author's username on this source
+            views: Aggregate producing total views on this source
+        """
+        group_field, z_metric = cls.TOP_CONFIG[top_type]
         
-        data = list(
+        return list(
             queryset
-            .values(x=F(group_field))
-            .annotate(y=Count('id'), z=z_metric)
-            .order_by('-y')[:10]
+            .values(x=F(group_field or author_field))
+            .annotate(y=views, z=z_metric)
+            .order_by('-y', 'x')[:10]
         )
 
-        cache.set(cache_key, data, timeout=cls.CACHE_TIMEOUT)
-        return data
-
     @classmethod
     def get_performance_analytics(cls, filters: Dict) -> List[Dict]:
         """
         API #3: Time-series performance with growth calculation.
         
-        Auto-selects granularity based on date range:
+        Auto-selects granularity based on the filtered date range (the data's
+        own span when the filters leave it open):
             - >365 days: Monthly
             - >30 days: Weekly
             - <=30 days: Daily
@@ -179,82 +381,136 @@ class AnalyticsService:
         """
         cache_key = cls._generate_cache_key("perf", filters=filters)
         
-        if cached := cache.get(cache_key):
-            return cached
-
-        queryset = BlogView.objects.select_related('blog', 'blog__author', 'country')
-        queryset = cls._apply_filters(queryset, filters)
+        def compute():
+            queryset = cls._apply_filters(BlogView.objects, filters)
+            return cls._aggregate_performance(queryset, 'timestamp', Count('id'), filters)
 
-        # Check if queryset has data
-        if not queryset.exists():
-            logger.info("No BlogView data found for performance analytics. Returning empty results.")
-            return []
+        return cls._get_or_compute(cache_key, compute)
 
-        # Determine time granularity
-        date_range = queryset.aggregate(min=Min('timestamp'), max=Max('timestamp'))
-        min_date = date_range['min']
-        max_date = date_range['max']
-        
-        # Handle edge case where min/max might be None
-        if not min_date or not max_date:
-            logger.warning("Invalid date range in performance analytics. Returning empty results.")
-            return []
-        
-        days = (max_date - min_date).days
+    @classmethod
+    def _aggregate_performance(cls, queryset, time_field: str, views, filters: Dict) -> List[Dict]:
+        """
+        Time-series aggregation shared by the BlogView and rollup sources.
         
-        # Handle edge case where days is 0 or negative
-        if days <= 0:
-            days = 1  # Default to daily granularity
+        Args:
+            queryset: Filtered BlogView or DailyBlogViewRollup queryset
+            time_field: 'timestamp' (BlogView) or 'date' (rollup)
+            views: Aggregate producing total views on this source
+            filters: Filters applied to queryset, used to pick granularity
+        """
+        is_datetime = isinstance(queryset.model._meta.get_field(time_field), DateTimeField)
+        buckets = (
+            TruncMonth(time_field, output_field=DateField()),
+            TruncWeek(time_field, output_field=DateField()),
+            # Daily buckets are a plain timestamp::date cast, not date_trunc();
+            # the rollup's date column is grouped on as-is
+            TruncDate(time_field) if is_datetime else F(time_field),
+        )
 
-        if days > 365:
-            trunc_func = TruncMonth('timestamp')
+        # Determine time granularity: from the filters when they bound the
+        # range, otherwise in SQL from the data's own span (same query)
+        days = cls._filter_span_days(filters)
+        if days is None:
+            # date_trunc() the daily bucket by a unit the subquery picks;
+            # referenced once, so Postgres plans a single InitPlan for it
+            unit = cls._bucket_unit_subquery(queryset, time_field, is_datetime)
+            trunc_func = Cast(
+                Func(unit, buckets[2], function='DATE_TRUNC', output_field=DateTimeField()),
+                output_field=DateField(),
+            )
+        elif days > 365:
+            trunc_func = buckets[0]
         elif days > 30:
-            trunc_func = TruncWeek('timestamp')
+            trunc_func = buckets[1]
         else:
-            trunc_func = TruncDay('timestamp')
+            trunc_func = buckets[2]
 
-        # Aggregate by period
+        # Aggregate by period; the previous period's views come from the
+        # same query via LAG, so no Python pass has to carry state
         raw_data = (
             queryset
             .annotate(period=trunc_func)
             .values('period')
-            .annotate(views=Count('id'), blogs=Count('blog', distinct=True))
+            .annotate(views=views, blogs=Count('blog', distinct=True))
+            .annotate(prev_views=Window(expression=Lag('views'), order_by=F('period').asc()))
             .order_by('period')
+            .values_list('period', 'views', 'blogs', 'prev_views')
         )
 
-        # Calculate growth percentage for each period
         results = cls._calculate_growth_periods(raw_data)
-
-        cache.set(cache_key, results, timeout=cls.CACHE_TIMEOUT)
+        if not results:
+            logger.info("No view data found for performance analytics. Returning empty results.")
         return results
 
+    @classmethod
+    def _filter_span_days(cls, filters: Dict):
+        """
+        Number of days the filters bound the time series to, or None if open.
+        
+        A year filter always buckets monthly.
+        """
+        if filters.get('year'):
+            return 366
+        start_date, end_date = filters.get('start_date'), filters.get('end_date')
+        if start_date and end_date:
+            return (end_date - start_date).days
+        return None
+
+    @classmethod
+    def _bucket_unit_subquery(cls, queryset, time_field: str, is_datetime: bool) -> Subquery:
+        """
+        Scalar subquery with the date_trunc() unit for the data's MAX - MIN span.
+        
+        'month' beyond 365 days, 'week' beyond 30, otherwise 'day'. Postgres
+        runs it once as an InitPlan of the aggregation query, so an unbounded
+        request still costs a single round-trip and a single extra scan.
+        """
+        # timestamp - timestamp is an interval (whole days as timedelta.days);
+        # date - date is already an integer
+        template = 'EXTRACT(DAY FROM %(expressions)s)' if is_datetime else '(%(expressions)s)'
+        span = Func(
+            Max(time_field), Min(time_field),
+            template=template, arg_joiner=' - ', output_field=IntegerField(),
+        )
+        unit = Case(
+            When(GreaterThan(span, 365), then=Value('month')),
+            When(GreaterThan(span, 30), then=Value('week')),
+            default=Value('day'),
+            output_field=CharField(),
+        )
+        # Grouping on a constant aggregates the whole filtered set
+        return Subquery(
+            queryset.order_by().annotate(_all=Value(1)).values('_all').annotate(unit=unit).values('unit')
+        )
+
     @classmethod
     def _calculate_growth_periods(cls, raw_data) -> List[Dict]:
         """
-        Calculate growth percentage for time-series data.
+        Format time-series rows with their growth percentage.
         
         Args:
-            raw_data: QuerySet results with 'period', 'views', 'blogs'
+            raw_data: (period, views, blogs, prev_views) tuples, prev_views
+                being NULL for the first period
             
         Returns:
             List of {x: "date (N blogs)", y: views, z: growth_percent}
         """
-        results = []
-        prev_views = 0
-
-        for entry in raw_data:
-            views = entry['views']
-            # Calculate growth: ((current - previous) / previous) * 100
-            growth = ((views - prev_views) / prev_views * 100) if prev_views > 0 else 0.0
-            
-            results.append({
-                "x": f"{entry['period'].strftime('%Y-%m-%d')} ({entry['blogs']} blogs)",
+        return [
+            {
+                # Periods are always dates, so isoformat() gives YYYY-MM-DD
+                # without strftime's format parsing
+                "x": f"{period.isoformat()} ({blogs} blogs)",
                 "y": views,
-                "z": round(growth, 2),
-            })
-            prev_views = views
-        
-        return results
+                # Growth: ((current - previous) / previous) * 100
+                "z": round(cls._growth(views, prev_views), 2),
+            }
+            for period, views, blogs, prev_views in raw_data
+        ]
+
+    @staticmethod
+    def _growth(views: int, prev_views) -> float:
+        """Percentage change from prev_views, 0.0 when there is no previous period."""
+        return (views - prev_views) / prev_views * 100 if prev_views else 0.0
 
     @classmethod
     def _build_summary_filters(cls, filters: Dict) -> Q:
@@ -266,6 +522,13 @@ class AnalyticsService:
         that leverages the pre-calculated data structure. This eliminates
         the need for complex filtering logic at query time.
         """
+        return cls._summary_q(cls._freeze_filters(filters))
+
+    @classmethod
+    @lru_cache(maxsize=512)
+    def _summary_q(cls, frozen: tuple) -> Q:
+        """Q object for a frozen filter signature, memoized like _blogview_q()."""
+        filters = dict(frozen)
         q_objects = Q()
         
         # Date filters (mutually exclusive: year OR date range)
@@ -280,15 +543,15 @@ class AnalyticsService:
                 end_date_value = end_date.date() if isinstance(end_date, datetime) else end_date
                 q_objects &= Q(date__lte=end_date_value)
         
-        # Country filters
-        if country_codes := filters.get('country_codes'):
-            q_objects &= Q(country__code__in=country_codes)
-        if exclude_codes := filters.get('exclude_country_codes'):
-            q_objects &= ~Q(country__code__in=exclude_codes)
+        # Country filters (already resolved to ids by _freeze_filters)
+        if (country_ids := filters.get('country_codes')) is not None:
+            q_objects &= Q(country_id__in=country_ids)
+        if (exclude_ids := filters.get('exclude_country_codes')) is not None:
+            q_objects &= ~Q(country_id__in=exclude_ids)
         
         # Author filter
         if author := filters.get('author_username'):
-            q_objects &= Q(author__username=author)
+            q_objects &= Q(author_id__in=User.objects.filter(username=author).values('id'))
         
         return q_objects
 
@@ -309,36 +572,169 @@ class AnalyticsService:
         """
         cache_key = cls._generate_cache_key("grouped_fast", type=object_type, filters=filters)
         
-        if cached := cache.get(cache_key):
-            return cached
-
-        # Check if pre-calculated data exists
-        if not DailyAnalyticsSummary.objects.exists():
-            logger.warning(
-                "No pre-calculated summaries found. "
-                "Run 'python manage.py precalculate_stats' first. "
-                "Returning empty results."
+        def compute():
+            # Check if pre-calculated data exists
+            if not DailyAnalyticsSummary.objects.exists():
+                logger.warning(
+                    "No pre-calculated summaries found. "
+                    "Run 'python manage.py precalculate_stats' first. "
+                    "Returning empty results."
+                )
+                return []
+
+            # Build declarative query - no complex conditional logic
+            query_filters = cls._build_summary_filters(filters)
+            group_field = 'country__code' if object_type == 'country' else 'author__username'
+
+            # Filter out null values to avoid grouping issues
+            # When grouping by country, exclude null countries
+            # When grouping by author, exclude null authors
+            null_filter = {f'{group_field}__isnull': False}
+
+            # Simple aggregation on pre-calculated data
+            rows = (
+                DailyAnalyticsSummary.objects
+                .filter(query_filters)
+                .filter(**null_filter)
+                .values_list(group_field)
+                .annotate(y=Sum('unique_blogs'), z=Sum('total_views'))
+                .order_by('-z')
             )
-            return []
-
-        # Build declarative query - no complex conditional logic
-        query_filters = cls._build_summary_filters(filters)
-        group_field = 'country__code' if object_type == 'country' else 'author__username'
-        
-        # Filter out null values to avoid grouping issues
-        # When grouping by country, exclude null countries
-        # When grouping by author, exclude null authors
-        null_filter = {f'{group_field}__isnull': False}
-        
-        # Simple aggregation on pre-calculated data
-        data = list(
-            DailyAnalyticsSummary.objects
-            .filter(query_filters)
-            .filter(**null_filter)
-            .values(x=F(group_field))
-            .annotate(y=Sum('unique_blogs'), z=Sum('total_views'))
-            .order_by('-z')
+            return [{'x': x, 'y': y, 'z': z} for x, y, z in rows]
+
+        return cls._get_or_compute(cache_key, compute)
+
+    @classmethod
+    def _build_rollup_filters(cls, filters: Dict) -> Q:
+        """
+        Build declarative Q object for DailyBlogViewRollup queries.
+        
+        Same date/country/author fields as the summary table, plus blog_id
+        since the rollup keeps the blog dimension.
+        """
+        q_objects = cls._build_summary_filters(filters)
+        if blog_id := filters.get('blog_id'):
+            q_objects &= Q(blog_id=blog_id)
+        return q_objects
+
+    @staticmethod
+    def _day_aligned(filters: Dict) -> bool:
+        """
+        Whether the date filters fall on whole UTC days, like rollup dates.
+        
+        start_date must be a midnight and end_date the last microsecond of
+        a day. Other bounds (e.g. range shortcuts, which end at now) would be
+        widened to whole days by the rollup, so they are answered in real time.
+        """
+        start_date, end_date = filters.get('start_date'), filters.get('end_date')
+        if isinstance(start_date, datetime) and start_date.astimezone(dt_timezone.utc).time() != dt_time.min:
+            return False
+        if isinstance(end_date, datetime) and end_date.astimezone(dt_timezone.utc).time() != dt_time.max:
+            return False
+        return True
+
+    @classmethod
+    def _rollup_available(cls) -> bool:
+        """Whether the rollup view has been populated."""
+        if DailyBlogViewRollup.objects.exists():
+            return True
+        logger.info(
+            "Daily rollup is empty. "
+            "Run 'python manage.py precalculate_stats' to populate it. "
+            "Falling back to real-time BlogView queries."
         )
+        return False
 
-        cache.set(cache_key, data, timeout=cls.CACHE_TIMEOUT)
-        return data
+    @classmethod
+    def get_top_analytics_fast(cls, top_type: str, filters: Dict) -> List[Dict]:
+        """
+        API #2 using the daily rollup materialized view.
+        
+        Sums pre-aggregated daily counts instead of counting raw events, with
+        identical results at day granularity. Unfiltered requests read the
+        all-time top 10 view instead. Falls back to get_top_analytics()
+        while the rollup is empty or the date filters are not whole days.
+        """
+        cache_key = cls._generate_cache_key("top_fast", type=top_type, filters=filters)
+        
+        def compute():
+            # Unfiltered (landing page): read the precomputed all-time top 10
+            if not filters:
+                if data := list(
+                    TopViewsAllTime.objects
+                    .filter(top_type=top_type)
+                    .order_by('-y', 'x')
+                    .values('x', 'y', 'z')
+                ):
+                    return data
+
+            if not cls._day_aligned(filters) or not cls._rollup_available():
+                return cls.get_top_analytics(top_type, filters)
+
+            queryset = DailyBlogViewRollup.objects.filter(cls._build_rollup_filters(filters))
+            return cls._aggregate_top(queryset, top_type, 'author__username', Sum('total_views'))
+
+        return cls._get_or_compute(cache_key, compute)
+
+    @classmethod
+    def get_performance_analytics_fast(cls, filters: Dict) -> List[Dict]:
+        """
+        API #3 using the daily rollup materialized view.
+        
+        Same granularity rules as get_performance_analytics(). Falls back to
+        it while the rollup is empty or the date filters are not whole days.
+        """
+        cache_key = cls._generate_cache_key("perf_fast", filters=filters)
+        
+        def compute():
+            if not cls._day_aligned(filters) or not cls._rollup_available():
+                return cls.get_performance_analytics(filters)
+
+            queryset = DailyBlogViewRollup.objects.filter(cls._build_rollup_filters(filters))
+            return cls._aggregate_performance(queryset, 'date', Sum('total_views'), filters)
+
+        return cls._get_or_compute(cache_key, compute)
+
+    @classmethod
+    async def get_dashboard(cls, object_type: str, top_type: str, filters: Dict) -> Dict[str, List[Dict]]:
+        """
+        APIs #1-#3 for one dashboard load, fetched concurrently.
+        
+        All three cache lookups are batched into one Redis round-trip. Only
+        the misses are computed, each in its own worker thread (and so on its
+        own database connection), letting those queries overlap instead of
+        queuing. Misses are written back by the _fast methods themselves.
+        
+        Worker threads are outside Django's request cycle, so each call
+        closes its thread's connection itself rather than leaking it.
+        
+        Returns:
+            {grouped: [...], top: [...], performance: [...]}
+        """
+        # Same keys the _fast methods cache under
+        keys = {
+            'grouped': cls._generate_cache_key("grouped_fast", type=object_type, filters=filters),
+            'top': cls._generate_cache_key("top_fast", type=top_type, filters=filters),
+            'performance': cls._generate_cache_key("perf_fast", filters=filters),
+        }
+        calls = {
+            'grouped': lambda: cls.get_grouped_analytics_fast(object_type, filters),
+            'top': lambda: cls.get_top_analytics_fast(top_type, filters),
+            'performance': lambda: cls.get_performance_analytics_fast(filters),
+        }
+
+        def run(name):
+            try:
+                return calls[name]()
+            finally:
+                # close_old_connections() would keep it open for CONN_MAX_AGE
+                connection.close()
+
+        cached = cls._cache_get_many(list(keys.values()))
+        bundle = {name: cached[key] for name, key in keys.items() if key in cached}
+        missing = [name for name in keys if name not in bundle]
+        results = await asyncio.gather(
+            *(sync_to_async(run, thread_sensitive=False)(name) for name in missing)
+        )
+        bundle.update(zip(missing, results))
+        return {name: bundle[name] for name in keys}
@@ -1,11 +1,43 @@
 # src/analytics/tests.py
-from django.test import TestCase
+import threading
+from datetime import timedelta
+from io import StringIO
+
+from asgiref.sync import async_to_sync
+from django.test import TestCase, TransactionTestCase, override_settings
 from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.core.management import call_command
+from django.utils import timezone
 from rest_framework.test import APIClient
 from analytics.models import Country, Blog, BlogView
+from analytics.api.serializers import AnalyticsFilterSerializer
 from analytics.services import AnalyticsService
 from django.test.utils import CaptureQueriesContext
 from django.db import connection
+
+
+# Tests clear every cache tier, so never point them at the configured Redis
+# (REDIS_URL may be a shared or production instance)
+TEST_CACHES = override_settings(CACHES={
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'analytics-test-default',
+    },
+    'local': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'analytics-test-local',
+    },
+})
+
+
+def clear_caches():
+    """Empty both the shared and the per-process cache tiers."""
+    for alias in caches:
+        caches[alias].clear()
+
+
+@TEST_CACHES
 class AnalyticsAPITest(TestCase):
     def setUp(self):
         # Create test data
@@ -19,6 +51,10 @@ class AnalyticsAPITest(TestCase):
         BlogView.objects.create(blog=self.blog, country=self.country_us)
         BlogView.objects.create(blog=self.blog, country=self.country_us)
         BlogView.objects.create(blog=self.blog, country=self.country_uk)
+        
+        # API #1 reads pre-calculated summaries; start every test cold
+        call_command('precalculate_stats', stdout=StringIO())
+        clear_caches()
     
     def test_api1_grouped_by_country(self):
         """Test API #1: Group by country with filters"""
@@ -80,10 +116,274 @@ class AnalyticsAPITest(TestCase):
         self.assertEqual(response.status_code, 200)
 
     def test_no_n_plus_1_queries(self):
-    """Ensure efficient queries"""
+        """Ensure efficient queries"""
     
-    with CaptureQueriesContext(connection) as context:
-        AnalyticsService.get_grouped_analytics('country', {})
+        with CaptureQueriesContext(connection) as context:
+            AnalyticsService.get_grouped_analytics('country', {})
     
-    # Should be minimal queries, not N per record
-    self.assertLess(len(context.captured_queries), 5)
\ No newline at end of file
+        # Should be minimal queries, not N per record
+        self.assertLess(len(context.captured_queries), 5)
+
+    def test_dashboard_rejects_invalid_types(self):
+        """Dashboard validates both path types before running any query"""
+        for url in ['/api/analytics/dashboard/blog/blog/', '/api/analytics/dashboard/country/author/']:
+            response = self.client.post(url, {}, format='json')
+            self.assertEqual(response.status_code, 400)
+
+    def test_dashboard_served_from_one_cache_round_trip(self):
+        """A warm dashboard is answered from cache without touching the DB"""
+        expected = {
+            'grouped': AnalyticsService.get_grouped_analytics_fast('country', {}),
+            'top': AnalyticsService.get_top_analytics_fast('blog', {}),
+            'performance': AnalyticsService.get_performance_analytics_fast({}),
+        }
+        caches['local'].clear()
+        
+        with CaptureQueriesContext(connection) as context:
+            data = async_to_sync(AnalyticsService.get_dashboard)('country', 'blog', {})
+        self.assertEqual(len(context.captured_queries), 0)
+        self.assertEqual(data, expected)
+
+    def test_query_count_independent_of_rows(self):
+        """Service methods never lazy-load FKs per row (no N+1 as data grows)"""
+        calls = [
+            lambda: AnalyticsService.get_grouped_analytics('country', {}),
+            lambda: AnalyticsService.get_grouped_analytics('user', {}),
+            lambda: AnalyticsService.get_grouped_analytics_fast('country', {}),
+            lambda: AnalyticsService.get_grouped_analytics_fast('user', {}),
+            lambda: AnalyticsService.get_top_analytics('blog', {}),
+            lambda: AnalyticsService.get_top_analytics('user', {}),
+            lambda: AnalyticsService.get_top_analytics('country', {}),
+            lambda: AnalyticsService.get_performance_analytics({}),
+            lambda: AnalyticsService.get_top_analytics_fast('blog', {}),
+            lambda: AnalyticsService.get_top_analytics_fast('user', {}),
+            lambda: AnalyticsService.get_performance_analytics_fast({}),
+        ]
+
+        def count_queries():
+            clear_caches()
+            counts = []
+            for call in calls:
+                with CaptureQueriesContext(connection) as context:
+                    call()
+                counts.append(len(context.captured_queries))
+            return counts
+
+        baseline = count_queries()
+
+        # More authors, blogs and countries means more result rows
+        for i in range(5):
+            author = User.objects.create_user(f'author{i}')
+            country = Country.objects.create(name=f'Country {i}', code=f'C{i}')
+            blog = Blog.objects.create(title=f'Blog {i}', author=author, content='...')
+            BlogView.objects.create(blog=blog, country=country)
+        call_command('precalculate_stats', stdout=StringIO())
+
+        self.assertEqual(count_queries(), baseline)
+
+    def test_country_filters_resolve_codes(self):
+        """Country codes map to ids in-process; unknown codes match nothing"""
+        data = AnalyticsService.get_grouped_analytics('country', {'country_codes': ['UK', 'XX']})
+        self.assertEqual([row['x'] for row in data], ['UK'])
+        
+        data = AnalyticsService.get_grouped_analytics('country', {'exclude_country_codes': ['XX']})
+        self.assertEqual(sum(row['z'] for row in data), 3)
+        
+        # A country added after the lookup table was loaded is still found
+        country_de = Country.objects.create(name='Germany', code='DE')
+        BlogView.objects.create(blog=self.blog, country=country_de)
+        data = AnalyticsService.get_grouped_analytics('country', {'country_codes': ['DE']})
+        self.assertEqual(data, [{'x': 'DE', 'y': 1, 'z': 1}])
+
+    def test_author_filter_semi_join(self):
+        """Author filters match by id subquery on every source"""
+        other = User.objects.create_user('other')
+        other_blog = Blog.objects.create(title='Other Blog', author=other, content='...')
+        BlogView.objects.create(blog=other_blog, country=self.country_us)
+        call_command('precalculate_stats', stdout=StringIO())
+        
+        filters = {'author_username': 'testuser'}
+        for data in [
+            AnalyticsService.get_grouped_analytics('user', filters),
+            AnalyticsService.get_grouped_analytics_fast('user', filters),
+        ]:
+            self.assertEqual([(row['x'], row['z']) for row in data], [('testuser', 3)])
+        self.assertEqual(AnalyticsService.get_top_analytics_fast('blog', filters)[0]['x'], 'Test Blog')
+        self.assertEqual(len(AnalyticsService.get_top_analytics('blog', filters)), 1)
+
+    def test_filter_q_memoized(self):
+        """Equal filter dicts share one memoized Q regardless of key order"""
+        first = AnalyticsService._build_blogview_filters({'year': 2024, 'country_codes': ['UK']})
+        second = AnalyticsService._build_blogview_filters({'country_codes': ['UK'], 'year': 2024})
+        self.assertIs(first, second)
+
+    def test_local_cache_tier(self):
+        """Hot results are served in-process; Redis hits refill the local tier"""
+        data = AnalyticsService.get_top_analytics('blog', {})
+        caches['default'].clear()
+        with CaptureQueriesContext(connection) as context:
+            self.assertEqual(AnalyticsService.get_top_analytics('blog', {}), data)
+        self.assertEqual(len(context.captured_queries), 0)
+        
+        AnalyticsService.get_top_analytics('user', {})
+        caches['local'].clear()
+        with CaptureQueriesContext(connection) as context:
+            AnalyticsService.get_top_analytics('user', {})
+        self.assertEqual(len(context.captured_queries), 0)
+
+    def test_cache_miss_single_flight(self):
+        """Callers wait for the lock holder's result instead of recomputing"""
+        key = 'analytics:test:single-flight'
+        caches['default'].add(f'{key}:lock', 1)
+        threading.Timer(0.2, AnalyticsService._cache_set, args=(key, [{'x': 'US'}])).start()
+        
+        def compute():
+            raise AssertionError('compute() ran while another worker held the lock')
+        
+        self.assertEqual(AnalyticsService._get_or_compute(key, compute), [{'x': 'US'}])
+
+    def test_performance_granularity_from_filters(self):
+        """Bounded filters pick the granularity without probing MIN/MAX"""
+        now = timezone.now()
+        filters = {'start_date': now - timedelta(days=7), 'end_date': now + timedelta(days=1)}
+        with CaptureQueriesContext(connection) as context:
+            data = AnalyticsService.get_performance_analytics(filters)
+        self.assertEqual(len(context.captured_queries), 1)
+        self.assertEqual(data, [{'x': f"{now:%Y-%m-%d} (1 blogs)", 'y': 3, 'z': 0.0}])
+        
+        data = AnalyticsService.get_performance_analytics({'year': now.year})
+        self.assertEqual(data[0]['x'], f"{now:%Y-%m}-01 (1 blogs)")
+
+    def test_empty_results_cached(self):
+        """A filter matching nothing is computed once, not once per caller"""
+        calls = []
+        
+        def compute():
+            calls.append(1)
+            return []
+        
+        for _ in range(3):
+            self.assertEqual(AnalyticsService._get_or_compute('analytics:test:empty', compute), [])
+        caches['local'].clear()
+        self.assertEqual(AnalyticsService._get_or_compute('analytics:test:empty', compute), [])
+        self.assertEqual(len(calls), 1)
+
+    def test_stale_value_served_while_refreshing(self):
+        """Past CACHE_TIMEOUT the stale value is served while another worker refreshes"""
+        key = 'analytics:test:stale'
+        AnalyticsService._cache_set(key, [{'x': 'old'}])
+        caches['default'].delete(f'{key}:fresh')
+        caches['local'].clear()
+        
+        caches['default'].add(f'{key}:lock', 1)
+        self.assertEqual(AnalyticsService._get_or_compute(key, lambda: [{'x': 'new'}]), [{'x': 'old'}])
+        
+        caches['default'].delete(f'{key}:lock')
+        self.assertEqual(AnalyticsService._get_or_compute(key, lambda: [{'x': 'new'}]), [{'x': 'new'}])
+        self.assertEqual(AnalyticsService._get_or_compute(key, lambda: [{'x': 'newer'}]), [{'x': 'new'}])
+
+    def test_unfiltered_top_reads_all_time_view(self):
+        """The landing-page top 10 is one read of the precomputed view"""
+        with CaptureQueriesContext(connection) as context:
+            data = AnalyticsService.get_top_analytics_fast('country', {})
+        self.assertEqual(len(context.captured_queries), 1)
+        self.assertIn('"analytics_mv_top_views_all_time"', context.captured_queries[0]['sql'])
+        self.assertEqual(data, [{'x': 'US', 'y': 2, 'z': 1}, {'x': 'UK', 'y': 1, 'z': 1}])
+
+    def test_grouped_by_country_joins_only_country(self):
+        """Aggregations join only the tables their grouping key needs"""
+        with CaptureQueriesContext(connection) as context:
+            AnalyticsService.get_grouped_analytics('country', {})
+        
+        sql = context.captured_queries[-1]['sql']
+        self.assertIn('"analytics_country"', sql)
+        self.assertNotIn('"analytics_blog"', sql)
+        self.assertNotIn('"auth_user"', sql)
+
+    def test_rollup_matches_realtime(self):
+        """The materialized rollup gives the same answers as raw BlogView queries"""
+        other = Blog.objects.create(title='Other Blog', author=self.user, content='...')
+        BlogView.objects.create(blog=other, country=self.country_uk)
+        call_command('precalculate_stats', stdout=StringIO())
+        
+        # {} is served by the all-time top view, a year filter by the rollup
+        for filters in [{}, {'year': timezone.now().year}]:
+            for top_type in ['blog', 'user', 'country']:
+                self.assertEqual(
+                    AnalyticsService.get_top_analytics_fast(top_type, filters),
+                    AnalyticsService.get_top_analytics(top_type, filters),
+                )
+        self.assertEqual(
+            AnalyticsService.get_top_analytics_fast('country', {'blog_id': other.id}),
+            [{'x': 'UK', 'y': 1, 'z': 1}],
+        )
+        self.assertEqual(
+            AnalyticsService.get_performance_analytics_fast({}),
+            AnalyticsService.get_performance_analytics({}),
+        )
+
+    def test_serializer_fields_not_shared(self):
+        """Cached serializer fields are copied with their own child and validators"""
+        first = AnalyticsFilterSerializer().fields['country_codes']
+        second = AnalyticsFilterSerializer().fields['country_codes']
+        self.assertIsNot(first.child, second.child)
+        self.assertIs(first.child.parent, first)
+        self.assertIsNot(first.child.validators, second.child.validators)
+
+    def test_rollup_keeps_range_precision(self):
+        """Bounds off whole days are answered in real time, not widened to days"""
+        now = timezone.now()
+        filters = {'start_date': now - timedelta(days=1), 'end_date': now}
+        # Same UTC day as start_date, but before it
+        early = BlogView.objects.create(blog=self.blog, country=self.country_uk)
+        BlogView.objects.filter(id=early.id).update(timestamp=filters['start_date'] - timedelta(microseconds=1))
+        call_command('precalculate_stats', stdout=StringIO())
+        
+        self.assertEqual(
+            AnalyticsService.get_top_analytics_fast('country', filters),
+            [{'x': 'US', 'y': 2, 'z': 1}, {'x': 'UK', 'y': 1, 'z': 1}],
+        )
+        self.assertEqual(
+            AnalyticsService.get_performance_analytics_fast(filters),
+            AnalyticsService.get_performance_analytics(filters),
+        )
+        
+        # Whole UTC days are still read from the rollup
+        start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        filters = {'start_date': start, 'end_date': start + timedelta(days=1, microseconds=-1)}
+        with CaptureQueriesContext(connection) as context:
+            AnalyticsService.get_top_analytics_fast('country', filters)
+        self.assertIn('"analytics_mv_daily_blog_views"', context.captured_queries[-1]['sql'])
+
+
+@TEST_CACHES
+class DashboardThreadingTest(TransactionTestCase):
+    """Cold dashboards run on real worker threads, outside a test transaction"""
+
+    def setUp(self):
+        user = User.objects.create_user('testuser', 'test@test.com')
+        country = Country.objects.create(name='USA', code='US')
+        blog = Blog.objects.create(title='Test Blog', author=user, content='...')
+        BlogView.objects.create(blog=blog, country=country)
+        call_command('precalculate_stats', stdout=StringIO())
+        clear_caches()
+
+    def tearDown(self):
+        clear_caches()
+
+    def backend_count(self):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT count(*) FROM pg_stat_activity WHERE datname = current_database()"
+            )
+            return cursor.fetchone()[0]
+
+    def test_cold_dashboard_closes_thread_connections(self):
+        """Every miss is computed and its worker thread's connection is closed"""
+        before = self.backend_count()
+        data = async_to_sync(AnalyticsService.get_dashboard)('country', 'blog', {})
+        
+        self.assertEqual(data['grouped'][0]['x'], 'US')
+        self.assertEqual(data['top'], [{'x': 'Test Blog', 'y': 1, 'z': 1}])
+        self.assertEqual(len(data['performance']), 1)
+        self.assertEqual(self.backend_count(), before)
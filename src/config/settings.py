@@ -96,6 +96,17 @@ CACHES = {
         "LOCATION": os.environ.get("REDIS_URL", "redis://redis:6379/1"),
         "OPTIONS": {
             "CLIENT_CLASS": "django_redis.client.DefaultClient",
+            # Results are plain dicts of str/int/float: smaller and faster than pickle
+            "SERIALIZER": "django_redis.serializers.msgpack.MSGPackSerializer",
+        }
+    },
+    # Per-process tier in front of Redis for hot analytics keys
+    "local": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "analytics-local",
+        "TIMEOUT": 60,
+        "OPTIONS": {
+            "MAX_ENTRIES": 1024,
         }
     }
 }